@@ -1,23 +1,52 @@
 """Evergy Class Module."""
 
-import json
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from html.parser import HTMLParser
 from typing import Any, Final
 
 import aiohttp
+import orjson
 
 _LOGGER = logging.getLogger(__file__)
 
-_DEBUG: bool = False
-
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
 
 DAY_INTERVAL: Final = "d"
 HOUR_INTERVAL: Final = "h"
 FIFTEEN_MINUTE_INTERVAL: Final = "mi"
 
+_INTERVAL_DELTA: Final = {
+    FIFTEEN_MINUTE_INTERVAL: timedelta(minutes=15),
+    HOUR_INTERVAL: timedelta(hours=1),
+    DAY_INTERVAL: timedelta(days=1),
+}
+
+"""How long a fetched usage range stays fresh, per interval.
+
+Evergy only updates usage on hour/day boundaries, so identical requests
+from multiple sensors within the TTL can share one response.
+"""
+_USAGE_CACHE_TTL: Final = {
+    DAY_INTERVAL: 3600.0,
+    HOUR_INTERVAL: 900.0,
+    FIFTEEN_MINUTE_INTERVAL: 300.0,
+}
+_USAGE_CACHE_MAX_ENTRIES: Final = 32
+
+"""Request headers shared by every call.
+
+Built once at import so each request passes a ready dict to aiohttp;
+per-request values (Authorization, interactionId, ...) are merged in with a
+single dict construction where needed.
+"""
+_UA_HEADERS: Final = {"User-Agent": USER_AGENT}
+_JSON_HEADERS: Final = {"User-Agent": USER_AGENT, "Content-Type": "application/json"}
+_JSON_ORIGIN_HEADERS: Final = {**_JSON_HEADERS, "Origin": "https://www.evergy.com"}
+
 
 class InvalidAuth(Exception):
     """Error to indicate there is invalid auth."""
@@ -34,13 +63,10 @@ def get_past_date(days_back: int = 1) -> datetime:
     :param days_back: The number of days back to get the date for
     :return: The date in the past
     """
-    date_today = datetime.now(timezone.utc).date()
-    dt_today = datetime(
-            year = date_today.year,
-            month = date_today.month,
-            day = date_today.day,
-        )
-    return dt_today - timedelta(days=days_back)
+    midnight_today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+    return midnight_today - timedelta(days=days_back)
 
 
 def get_end_date_from_number_of_intervals(
@@ -55,12 +81,8 @@ def get_end_date_from_number_of_intervals(
     :param interval: 'd', 'h', or 'mi'
     :return: The datetime from the specified intervals
     """
-    num_intervals -= 1
-    if interval == "mi":
-        return from_date + timedelta(minutes=15*num_intervals)
-    if interval == "h":
-        return from_date + timedelta(hours=num_intervals)
-    return from_date + timedelta(days=num_intervals)
+    delta = _INTERVAL_DELTA.get(interval, _INTERVAL_DELTA[DAY_INTERVAL])
+    return from_date + delta * (num_intervals - 1)
 
 
 class EvergyException(Exception):
@@ -71,34 +93,97 @@ class EvergyException(Exception):
         super().__init__(message)
 
 
-class EvergyDavinciWidgetParser(HTMLParser):
-    """HTML parser to extract Davinci api and flow data for PingOne Authentication."""
-
-    def __init__(self) -> None:
-        """Initialize."""
-        super().__init__()
-        self.data: dict[str, str] = {}
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        """Recognizes data-davinci attrs from davinci-widget-wrapper class."""
-        if tag == "div" and ("class", "davinci-widget-wrapper") in attrs:
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-company-id", attrs))
-            self.data["company_id"] = str(token)
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-sk-api-key", attrs))
-            self.data["sk_api_key"] = str(token)
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-api-root", attrs))
-            self.data["api_root"] = str(token)
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-policy-id", attrs))
-            self.data["policy_id"] = str(token)
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-post-processing-api", attrs))
-            self.data["post_processing_api"] = str(token)
-            _, token = next(filter(lambda attr: attr[0] == "data-davinci-datasource-item-id", attrs))
-            self.data["datasource_item_id"] = str(token)
+"""The davinci widget wrapper div and its data-davinci-* attributes.
+
+Scanning the raw login page with compiled regexes is much faster than feeding
+the whole document through an html.parser state machine just to read one div.
+"""
+_DAVINCI_RE: Final = re.compile(rb'<div[^>]*class="davinci-widget-wrapper"[^>]*>', re.IGNORECASE)
+_ATTR_RE: Final = re.compile(rb'data-davinci-([a-z-]+)="([^"]*)"')
+
+"""The widget attributes every later login step depends on."""
+_DAVINCI_KEYS: Final = (
+    "company_id",
+    "sk_api_key",
+    "api_root",
+    "policy_id",
+    "post_processing_api",
+    "datasource_item_id",
+)
+
+"""Raw data-davinci-* attribute suffix to auth_data key, built once at import."""
+_DAVINCI_KEY_MAP: Final = {key.replace("_", "-").encode(): key for key in _DAVINCI_KEYS}
+
+"""The flowId of a davinci response, matched without a full JSON parse."""
+_FLOWID_RE: Final = re.compile(rb'"flowId"\s*:\s*"([^"]+)"')
+
+"""Cached authentication state.
+
+The davinci widget data is static per Evergy deployment and the sdktoken
+stays valid long enough to reuse, so both are kept at module level. A warm
+cache saves the login page fetch and the sdktoken roundtrip on re-login.
+"""
+_AUTH_DATA_CACHE: dict[str, str] | None = None
+_SDK_TOKEN_CACHE: tuple[str, float] | None = None
+_SDK_TOKEN_TTL: Final = 3600.0
+_SDK_TOKEN_SAFETY_MARGIN: Final = 300.0
+
+
+def _invalidate_auth_caches() -> None:
+    """Drop the cached widget data and sdktoken after an auth failure."""
+    global _AUTH_DATA_CACHE, _SDK_TOKEN_CACHE
+    _AUTH_DATA_CACHE = None
+    _SDK_TOKEN_CACHE = None
+
+
+"""One shared ClientSession for all Evergy instances.
+
+The login flow fires nine-plus sequential requests to www.evergy.com and
+*.pingone.com; keeping the session (and its connection pool) alive across
+logins reuses the TLS connections instead of re-handshaking every cycle.
+"""
+_SESSION: aiohttp.ClientSession | None = None
+
+"""Account identifiers resolved at login, keyed by username.
+
+account_number and premise_id never change for a given username, so a
+re-login can skip the account summary and dashboard fetches entirely.
+"""
+_ACCOUNT_CACHE: dict[str, tuple[str, str, dict[str, Any]]] = {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it on first use."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _SESSION
 
 
 class EvergyLoginHandler:
     """Handle davinci widget authentication for Evergy Login page."""
 
+    __slots__ = (
+        "session",
+        "auth_data",
+        "access_token",
+        "connectionId",
+        "interactionId",
+        "flowId",
+        "id",
+        "_template_url",
+        "_setcookie_url",
+    )
+
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize."""
         self.session = session
@@ -108,10 +193,22 @@ class EvergyLoginHandler:
         self.interactionId: str
         self.flowId: str
         self.id: str
+        self._template_url: str
+        self._setcookie_url: str
+
+    def _refresh_connection_urls(self) -> None:
+        """Rebuild the capability URLs whenever connectionId changes."""
+        base = f"{self.auth_data['api_root']}/{self.auth_data['company_id']}/davinci"
+        self._template_url = f"{base}/connections/{self.connectionId}/capabilities/customHTMLTemplate"
+        self._setcookie_url = f"{base}/connections/{self.connectionId}/capabilities/setCookieWithoutUser"
 
     async def get_auth_data(self) -> None:
         """Parse davinci widget for api data."""
-        parse_auth_data = EvergyDavinciWidgetParser()
+        global _AUTH_DATA_CACHE
+
+        if _AUTH_DATA_CACHE is not None:
+            self.auth_data = _AUTH_DATA_CACHE
+            return
 
         login_page_url = "https://www.evergy.com/log-in"
 
@@ -119,16 +216,49 @@ class EvergyLoginHandler:
 
         async with self.session.get(
             login_page_url,
-            headers={"User-Agent": USER_AGENT},
+            headers=_UA_HEADERS,
             raise_for_status=True,
         ) as resp:
-            parse_auth_data.feed(await resp.text())
-            self.auth_data = parse_auth_data.data
+            """Read the page incrementally and stop as soon as the widget's
+            opening tag is buffered - the attributes live entirely inside it,
+            so the rest of the page never needs to be downloaded. Each scan
+            restarts a little before the previous chunk's end in case the tag
+            straddles a chunk boundary."""
+            body = bytearray()
+            widget = None
+            scan_from = 0
+            async for chunk in resp.content.iter_chunked(8192):
+                body += chunk
+                widget = _DAVINCI_RE.search(body, scan_from)
+                if widget:
+                    break
+                scan_from = max(0, len(body) - 4096)
+
+        assert widget, "Failed to get davinci widget data"
+
+        self.auth_data = {
+            _DAVINCI_KEY_MAP[key]: value.decode()
+            for key, value in _ATTR_RE.findall(body, widget.start(), widget.end())
+            if key in _DAVINCI_KEY_MAP
+        }
+
+        assert all(key in self.auth_data for key in _DAVINCI_KEYS), (
+            "Failed to get davinci widget data"
+        )
 
-            assert self.auth_data, "Failed to get davinci widget data"
+        _AUTH_DATA_CACHE = self.auth_data
 
     async def get_sdktoken(self) -> None:
         """First get the access_token."""
+        global _SDK_TOKEN_CACHE
+
+        if _SDK_TOKEN_CACHE is not None:
+            token, expiry = _SDK_TOKEN_CACHE
+            if time.monotonic() < expiry - _SDK_TOKEN_SAFETY_MARGIN:
+                self.access_token = token
+                return
+            _SDK_TOKEN_CACHE = None
+
         login_sdktoken_url = (
             self.auth_data["api_root"].replace("auth", "orchestrate-api")
             + "/v1/company/"
@@ -136,15 +266,17 @@ class EvergyLoginHandler:
             + "/sdktoken"
         )
 
-        _LOGGER.debug("Fetching Evergy login page: %s", login_sdktoken_url)
+        _LOGGER.debug("Fetching sdktoken: %s", login_sdktoken_url)
 
         async with self.session.get(
             login_sdktoken_url,
-            headers={"User-Agent": USER_AGENT, "x-sk-api-key": self.auth_data["sk_api_key"]},
+            headers={**_UA_HEADERS, "x-sk-api-key": self.auth_data["sk_api_key"]},
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.access_token = data["access_token"]
+            expires_in = float(data.get("expires_in", _SDK_TOKEN_TTL))
+            _SDK_TOKEN_CACHE = (self.access_token, time.monotonic() + expires_in)
 
     async def start_flow(self) -> None:
         """Start the davinci widget flow."""
@@ -161,42 +293,24 @@ class EvergyLoginHandler:
 
         async with self.session.get(
             login_start_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Authorization": "Bearer " + self.access_token,
-            },
+            headers={**_UA_HEADERS, "Authorization": "Bearer " + self.access_token},
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.id = data["id"]
             self.connectionId = data["connectionId"]
             self.interactionId = data["interactionId"]
             self.flowId = data["flowId"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "start_flow", "01")
+            self._refresh_connection_urls()
 
     async def get_login_form(self) -> None:
         """Retrieve submit form."""
-        login_template_url = (
-            self.auth_data["api_root"]
-            + "/"
-            + self.auth_data["company_id"]
-            + "/davinci/connections/"
-            + self.connectionId
-            + "/capabilities/customHTMLTemplate"
-        )
-
-        _LOGGER.debug("Fetching login template page: %s", login_template_url)
+        _LOGGER.debug("Fetching login template page: %s", self._template_url)
 
         async with self.session.post(
-            login_template_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-                "interactionId": self.interactionId,
-                "Origin": "https://www.evergy.com",
-            },
-            data=json.dumps(
+            self._template_url,
+            headers={**_JSON_ORIGIN_HEADERS, "interactionId": self.interactionId},
+            data=orjson.dumps(
                 {
                     "id": self.id,
                     "eventName": "continue",
@@ -204,32 +318,17 @@ class EvergyLoginHandler:
             ),
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.id = data["id"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "get_login_form", "02")
 
     async def submit_login_form(self, username: str, password: str) -> None:
         """Login to the utility website."""
-        login_template_url = (
-            self.auth_data["api_root"]
-            + "/"
-            + self.auth_data["company_id"]
-            + "/davinci/connections/"
-            + self.connectionId
-            + "/capabilities/customHTMLTemplate"
-        )
-
-        _LOGGER.debug("Submit login data to template page: %s", login_template_url)
+        _LOGGER.debug("Submit login data to template page: %s", self._template_url)
 
         async with self.session.post(
-            login_template_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-                "Origin": "https://www.evergy.com",
-            },
-            data=json.dumps(
+            self._template_url,
+            headers=_JSON_ORIGIN_HEADERS,
+            data=orjson.dumps(
                 {
                     "id": self.id,
                     "nextEvent": {
@@ -251,66 +350,42 @@ class EvergyLoginHandler:
             allow_redirects=False,
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
-            """If the submitted login form returns a different flowId, then the username doesn't exist."""
-            if data["flowId"] != self.flowId:
-                raise InvalidAuth("No such username. Login failed.")
-            """If the submitted login form returns the same id, then the password isn't correct."""
-            if data["id"] == self.id:
-                raise InvalidAuth("Wrong password. Login failed.")
-            self.id = data["id"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "submit_login_form", "03")
+            raw = await resp.read()
+
+        """If the submitted login form returns a different flowId, then the username doesn't exist.
+        A byte scan rejects that case without parsing the full response."""
+        flow = _FLOWID_RE.search(raw)
+        if flow is None or flow.group(1).decode() != self.flowId:
+            raise InvalidAuth("No such username. Login failed.")
+        data = orjson.loads(raw)
+        """If the submitted login form returns the same id, then the password isn't correct."""
+        if data["id"] == self.id:
+            raise InvalidAuth("Wrong password. Login failed.")
+        self.id = data["id"]
 
     async def get_new_connection_id(self) -> None:
         """Retrieve new connection id."""
-        login_template_url = (
-            self.auth_data["api_root"]
-            + "/"
-            + self.auth_data["company_id"]
-            + "/davinci/connections/"
-            + self.connectionId
-            + "/capabilities/customHTMLTemplate"
-        )
-
-        _LOGGER.debug("Fetching login template page: %s", login_template_url)
+        _LOGGER.debug("Fetching login template page: %s", self._template_url)
 
         async with self.session.post(
-            login_template_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-                "Origin": "https://www.evergy.com",
-            },
-            data=json.dumps({"id": self.id, "eventName": "continue"}),
+            self._template_url,
+            headers=_JSON_ORIGIN_HEADERS,
+            data=orjson.dumps({"id": self.id, "eventName": "continue"}),
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.id = data["id"]
             self.connectionId = data["connectionId"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "get_new_connection_id", "04")
+            self._refresh_connection_urls()
 
     async def get_new_connection_cookie(self) -> None:
         """Set complete to generate cookie."""
-        login_set_cookie_url = (
-            self.auth_data["api_root"]
-            + "/"
-            + self.auth_data["company_id"]
-            + "/davinci/connections/"
-            + self.connectionId
-            + "/capabilities/setCookieWithoutUser"
-        )
-
-        _LOGGER.debug("Start setCookieWithoutUser processing with new connectionId: %s", login_set_cookie_url)
+        _LOGGER.debug("Start setCookieWithoutUser processing with new connectionId: %s", self._setcookie_url)
 
         async with self.session.post(
-            login_set_cookie_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(
+            self._setcookie_url,
+            headers=_JSON_HEADERS,
+            data=orjson.dumps(
                 {
                     "eventName": "complete",
                     "parameters": {},
@@ -319,31 +394,17 @@ class EvergyLoginHandler:
             ),
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.id = data["id"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "get_new_connection_cookie", "05")
 
     async def get_new_access_token(self) -> None:
         """Set cookie and generate new access_token."""
-        login_set_cookie_url = (
-            self.auth_data["api_root"]
-            + "/"
-            + self.auth_data["company_id"]
-            + "/davinci/connections/"
-            + self.connectionId
-            + "/capabilities/setCookieWithoutUser"
-        )
-
-        _LOGGER.debug("Fetch new access_token with new connectionId: %s", login_set_cookie_url)
+        _LOGGER.debug("Fetch new access_token with new connectionId: %s", self._setcookie_url)
 
         async with self.session.post(
-            login_set_cookie_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(
+            self._setcookie_url,
+            headers=_JSON_HEADERS,
+            data=orjson.dumps(
                 {
                     "eventName": "complete",
                     "parameters": {},
@@ -352,11 +413,9 @@ class EvergyLoginHandler:
             ),
             raise_for_status=True,
         ) as resp:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             self.id = data["id"]
             self.access_token = data["access_token"]
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "get_new_access_token", "06")
 
     async def postprocessing_api(self) -> None:
         """Postprocess url to get access by cookie."""
@@ -366,41 +425,34 @@ class EvergyLoginHandler:
 
         async with self.session.post(
             login_postprocess_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-            },
-            data=json.dumps({"Token": self.access_token, "DataSourceItemId": self.auth_data["datasource_item_id"]}),
+            headers=_JSON_HEADERS,
+            data=orjson.dumps({"Token": self.access_token, "DataSourceItemId": self.auth_data["datasource_item_id"]}),
             raise_for_status=True,
         ) as resp:
-            await resp.json(content_type=None)
-            if _DEBUG:
-                await Evergy.log_response(resp, self.session, "postprocessing_api", "07")
+            orjson.loads(await resp.read())
 
     async def login(self, username: str, password: str) -> None:
-        """First parse davinci widget for api data."""
-        await EvergyLoginHandler.get_auth_data(self)
-        """Get the access_token."""
-        await EvergyLoginHandler.get_sdktoken(self)
-        """Start the flow."""
-        await EvergyLoginHandler.start_flow(self)
-        """Retrieve submit form."""
-        await EvergyLoginHandler.get_login_form(self)
-        """Submit login form."""
-        await EvergyLoginHandler.submit_login_form(self, username, password)
-        """Retrieve new connection id."""
-        await EvergyLoginHandler.get_new_connection_id(self)
-        """Set complete to generate cookie."""
-        await EvergyLoginHandler.get_new_connection_cookie(self)
-        """Set cookie and generate new access_token."""
-        await EvergyLoginHandler.get_new_access_token(self)
-        """Postprocess url at Evergy to get access by cookie."""
-        await EvergyLoginHandler.postprocessing_api(self)
+        """Run the davinci flow steps in order."""
+        steps = (
+            self.get_auth_data,
+            self.get_sdktoken,
+            self.start_flow,
+            self.get_login_form,
+            lambda: self.submit_login_form(username, password),
+            self.get_new_connection_id,
+            self.get_new_connection_cookie,
+            self.get_new_access_token,
+            self.postprocessing_api,
+        )
+        for step in steps:
+            await step()
 
 
 class EvergyLogoutHandler:
     """Handle Evergy Logout and close session."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize."""
         self.session = session
@@ -413,19 +465,31 @@ class EvergyLogoutHandler:
 
         async with self.session.get(
             logout_page_url,
-            headers={"User-Agent": USER_AGENT},
+            headers=_UA_HEADERS,
             raise_for_status=True,
         ) as resp:
             text = await resp.text()
 
             assert text, "Failed to logout."
 
-        await self.session.close()
-
 
 class Evergy:
     """Evergy class."""
 
+    __slots__ = (
+        "logged_in",
+        "session",
+        "username",
+        "password",
+        "usage_data",
+        "dashboard_data",
+        "account_number",
+        "premise_id",
+        "account_summary_url",
+        "account_dashboard_url",
+        "_usage_cache",
+    )
+
     def __init__(self, username: str, password: str) -> None:
         """Initialize."""
         self.logged_in: bool = False
@@ -442,9 +506,9 @@ class Evergy:
         self.account_dashboard_url: str = (
             "https://www.evergy.com/api/account/{accountNum}/dashboard/current"
         )
-        self.usageDataUrl: str = (
-            "https://www.evergy.com/api/report/usage/{premise_id}?interval={interval}&from={start}&to={end}"
-        )
+        self._usage_cache: OrderedDict[
+            tuple[str | None, str, str, str], tuple[float, dict[str, Any]]
+        ] = OrderedDict()
 
     async def login(self) -> bool:
         """Login to Evergy.
@@ -453,45 +517,105 @@ class Evergy:
         requests_html or selenium I decided to build the dynamic request form the
         hard way. It has been a learning experience.
         """
-        self.session = aiohttp.ClientSession()
-
-        """Evergy log-in flow with davinci widget."""
-        login_evergy = EvergyLoginHandler(self.session)
-        await login_evergy.login(self.username, self.password)
-
-        async with self.session.get(
-            self.account_summary_url,
-            headers={"User-Agent": USER_AGENT},
-            raise_for_status=True,
-        ) as response:
-            account_data = await response.json(content_type=None)
-            assert account_data, "Failed to get Evergy account data"
-            if len(account_data) == 0:
-                self.logged_in = False
-            else:
-                # shape is: [{"accountNumber": 123456789, "oPowerDomain": "kcpl.opower.com", ...}]
-                self.account_number = account_data[0]["accountNumber"]
+        self.session = _get_session()
+
+        cached_account = _ACCOUNT_CACHE.get(self.username)
+        if cached_account is not None:
+            """The shared session may still hold a valid auth cookie from an
+            earlier login. Probe the dashboard with it first; on success the
+            whole davinci flow is skipped."""
+            self.account_number, self.premise_id, self.dashboard_data = cached_account
+            try:
                 async with self.session.get(
                     self.account_dashboard_url.format(accountNum=self.account_number),
-                    headers={"User-Agent": USER_AGENT},
+                    headers=_UA_HEADERS,
                     raise_for_status=True,
                 ) as resp:
-                    self.dashboard_data = await resp.json(content_type=None)
-
-                self.premise_id = self.dashboard_data["addresses"][0]["premiseId"]
-                self.logged_in = (
-                    self.account_number is not None and self.premise_id is not None
+                    self.dashboard_data = orjson.loads(await resp.read())
+            except (aiohttp.ClientResponseError, orjson.JSONDecodeError):
+                """Cookie expired or the endpoint bounced us to the login
+                page; fall through to the full flow."""
+            else:
+                self.logged_in = True
+                _LOGGER.debug(
+                    "Logged in as: %s, on account: %s (reused session cookie)",
+                    self.username,
+                    self.account_number,
                 )
+                return self.logged_in
+
+        """Evergy log-in flow with davinci widget."""
+        login_evergy = EvergyLoginHandler(self.session)
+        caches_were_warm = _AUTH_DATA_CACHE is not None or _SDK_TOKEN_CACHE is not None
+        try:
+            await login_evergy.login(self.username, self.password)
+        except (InvalidAuth, aiohttp.ClientResponseError):
+            """Stale cached auth state can surface as a 401 or a broken flow.
+            Drop the caches and rerun the flow once from scratch - but only
+            when the attempt actually started from warm caches; the attempt
+            itself populates them, so a cold-start failure (e.g. a wrong
+            password) must not be resubmitted."""
+            if not caches_were_warm:
+                raise
+            _invalidate_auth_caches()
+            await login_evergy.login(self.username, self.password)
+
+        cached_account = _ACCOUNT_CACHE.get(self.username)
+        if cached_account is not None:
+            self.account_number, self.premise_id, self.dashboard_data = cached_account
+            self.logged_in = True
+        else:
+            async with self.session.get(
+                self.account_summary_url,
+                headers=_UA_HEADERS,
+                raise_for_status=True,
+            ) as response:
+                account_data = orjson.loads(await response.read())
+                assert account_data, "Failed to get Evergy account data"
+                if len(account_data) == 0:
+                    self.logged_in = False
+                else:
+                    # shape is: [{"accountNumber": 123456789, "oPowerDomain": "kcpl.opower.com", ...}]
+                    self.account_number = account_data[0]["accountNumber"]
+                    async with self.session.get(
+                        self.account_dashboard_url.format(accountNum=self.account_number),
+                        headers=_UA_HEADERS,
+                        raise_for_status=True,
+                    ) as resp:
+                        self.dashboard_data = orjson.loads(await resp.read())
+
+                    self.premise_id = self.dashboard_data["addresses"][0]["premiseId"]
+                    self.logged_in = (
+                        self.account_number is not None and self.premise_id is not None
+                    )
+                    if self.logged_in:
+                        _ACCOUNT_CACHE[self.username] = (
+                            self.account_number,
+                            self.premise_id,
+                            self.dashboard_data,
+                        )
         if self.logged_in:
             _LOGGER.debug("Logged in as: %s, on account: %s", self.username, self.account_number)
         return self.logged_in
 
+    def _usage_url(self, interval: str, start: str, end: str) -> str:
+        """Build the usage report URL for the current premise."""
+        return (
+            f"https://www.evergy.com/api/report/usage/{self.premise_id}"
+            f"?interval={interval}&from={start}&to={end}"
+        )
+
+    def invalidate_account_cache(self) -> None:
+        """Forget the cached account identifiers for this username."""
+        _ACCOUNT_CACHE.pop(self.username, None)
+
     async def logout(self):
         """Log out of Evergy Portal."""
 
         logout_evergy = EvergyLogoutHandler(self.session)
         await logout_evergy.logout()
         self.logged_in = False
+        self._usage_cache.clear()
 
     async def get_usage(self,
                         days: int = 1,
@@ -527,6 +651,24 @@ class Evergy:
         end = get_end_date_from_number_of_intervals(start, size, interval)
         return await self.get_usage_range(start, end, interval=interval)
 
+    async def get_usage_multi(self,
+                              ranges: list[tuple[datetime, datetime, str]]) -> list[dict[str, Any] | None]:
+        """Fetch several usage ranges concurrently.
+
+        The davinci login flow itself cannot be pipelined - every step consumes
+        the id returned by the previous one - but usage requests are independent
+        of each other, so they can share the pooled session concurrently.
+
+        :param ranges: (start, end, interval) tuples as taken by get_usage_range
+        :return: One get_usage_range result per tuple, in the same order
+        """
+        if not self.logged_in:
+            await self.login()
+        return await asyncio.gather(
+            *(self.get_usage_range(start, end, interval=interval)
+              for start, end, interval in ranges)
+        )
+
     async def get_usage_range(self,
                               start: datetime | None = None,
                               end: datetime | None = None,
@@ -549,38 +691,45 @@ class Evergy:
             _LOGGER.exception("%s",msg)
             raise EvergyException(msg)
 
-        url = self.usageDataUrl.format(
-            premise_id=self.premise_id,
-            interval=interval,
-            start=start.isoformat(),
-            end=end.isoformat(),
-        )
-        _LOGGER.debug("Fetching %s", url)
-        async with self.session.get(
-            url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-            },
-            raise_for_status=True,
-        ) as resp:
-            usage_response = await resp.json()
+        start_iso = start.isoformat()
+        end_iso = end.isoformat()
+        cache_key = (self.premise_id, start_iso, end_iso, interval)
+        cached = self._usage_cache.get(cache_key)
+        if cached is not None:
+            fetched_at, result = cached
+            if time.monotonic() - fetched_at < _USAGE_CACHE_TTL.get(interval, 300.0):
+                self._usage_cache.move_to_end(cache_key)
+                self.usage_data = result["usage"]
+                return result
+            del self._usage_cache[cache_key]
+
+        for attempt in range(2):
+            url = self._usage_url(interval, start_iso, end_iso)
+            _LOGGER.debug("Fetching %s", url)
+            try:
+                async with self.session.get(
+                    url,
+                    headers=_JSON_HEADERS,
+                    raise_for_status=True,
+                ) as resp:
+                    usage_response = orjson.loads(await resp.read())
+                break
+            except aiohttp.ClientResponseError as err:
+                if attempt or err.status not in (401, 404):
+                    raise
+                """The cached account identifiers may be stale; drop them
+                and log in again before the one retry."""
+                self.invalidate_account_cache()
+                self.logged_in = False
+                await self.login()
 
         # all errors handled above.
         if usage_response is None:
             self.usage_data = None
             return None
         self.usage_data = usage_response["data"]
-        return {"usage": self.usage_data , "dashboard": self.dashboard_data}
-
-    @staticmethod
-    async def log_response(
-        response: aiohttp.ClientResponse,
-        session: aiohttp.ClientSession,
-        note: str | None = None,
-        prefix: str | None = None,
-    ) -> None:
-        """Log any redirects and new cookies. Log full JSON when -vv is set."""
-        _LOGGER.debug("Response from: %s", response.url)
-
-        """This is just a stub so I can use the same code from evergy.py in pyEvergy.py"""
+        result = {"usage": self.usage_data, "dashboard": self.dashboard_data}
+        self._usage_cache[cache_key] = (time.monotonic(), result)
+        if len(self._usage_cache) > _USAGE_CACHE_MAX_ENTRIES:
+            self._usage_cache.popitem(last=False)
+        return result